@@ -1,21 +1,26 @@
-from uno import Game
+from uno import CounterRandom, Game
 from argparse import ArgumentParser, Namespace
-import random
+import logging
+import sys
 
 
 def parse_args() -> Namespace:
     parser = ArgumentParser()
     parser.add_argument("--seed", type=str, default=None, required=False)
+    parser.add_argument("--game", type=int, default=0, required=False)
     parser.add_argument("--player", type=str, default=None, required=False)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    rng = None
     if args.seed:
-        random.seed(args.seed)
+        # replay game number --game of the campaign with the given seed
+        rng = CounterRandom(args.seed, stream=args.game)
 
-    game = Game(human_player=args.player)
+    game = Game(human_player=args.player, rng=rng)
     game.run()
 
 
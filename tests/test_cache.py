@@ -0,0 +1,74 @@
+from typing import Optional
+from uno import COLORS, CachedStrategy, Card, Cards
+from uno._game import _Strategy
+
+
+class _MaxCardStrategy(_Strategy):
+    # deterministic and independent of the order of the legal cards
+    def __init__(self) -> None:
+        self.n_calls = 0
+
+    def select_card(self, legal_cards: Cards, top_card: Card, rng=None) -> Card:
+        self.n_calls += 1
+        card = max(legal_cards, key=lambda card: (card.symbol, card.color or ""))
+        if card.is_wild:
+            card.color = self.select_color()
+        return card
+
+    def select_color(self, rng=None) -> str:
+        return COLORS[0]
+
+
+def _select(strategy: CachedStrategy, legal_cards: Cards) -> Optional[Card]:
+    return strategy.select_card(legal_cards=legal_cards, top_card=Card("red", "1"))
+
+
+def test_cached_strategy_reuses_decisions() -> None:
+    inner = _MaxCardStrategy()
+    strategy = CachedStrategy(inner)
+
+    assert _select(strategy, [Card(None, "wild"), Card("red", "2")]).color == "red"
+    card = _select(strategy, [Card(None, "wild"), Card("red", "2"), Card("red", "2")])
+    assert card == Card(None, "wild")
+    assert card.color == "red"
+
+    assert inner.n_calls == 1
+    assert strategy.cache_info() == (1, 1, 100_000, 1)
+
+
+def test_cached_strategy_evicts_least_recently_used() -> None:
+    strategy = CachedStrategy(_MaxCardStrategy(), maxsize=2)
+    a, b, c = [Card("red", "2")], [Card("red", "3")], [Card("red", "4")]
+
+    _select(strategy, a)
+    _select(strategy, b)
+    _select(strategy, a)
+    _select(strategy, c)  # evicts b
+    _select(strategy, a)
+    _select(strategy, b)
+
+    assert strategy.cache_info() == (2, 4, 2, 2)
+
+
+def test_cached_strategy_save_and_load(tmp_path) -> None:
+    path = tmp_path / "cache.json"
+    strategy = CachedStrategy(_MaxCardStrategy())
+    _select(strategy, [Card(None, "wild-draw-4"), Card("blue", "skip")])
+    strategy.save(path)
+
+    inner = _MaxCardStrategy()
+    strategy = CachedStrategy(inner)
+    strategy.load(path)
+    legal_cards = [Card("blue", "skip"), Card(None, "wild-draw-4")]
+    card = _select(strategy, legal_cards)
+
+    assert card == inner.select_card(legal_cards, top_card=Card("red", "1"))
+    assert card == Card(None, "wild-draw-4")
+    assert card.color == "red"
+    assert inner.n_calls == 1
+
+
+def test_cached_strategy_does_not_cache_colors() -> None:
+    strategy = CachedStrategy(_MaxCardStrategy())
+    assert strategy.select_color() == COLORS[0]
+    assert strategy.cache_info() == (0, 0, 100_000, 0)
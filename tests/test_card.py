@@ -27,3 +27,13 @@ def test_card_equality_ignores_color_for_wild_cards() -> None:
     b = Card(None, "wild")
     b.color = "red"
     assert a == b
+
+
+def test_card_copy_resets_color_of_wild_cards() -> None:
+    card = Card(None, "wild")
+    card.color = "red"
+    copied = card.copy()
+    assert copied == card
+    assert copied is not card
+    assert copied.color is None
+    assert copied.is_wild
@@ -0,0 +1,97 @@
+from typing import Optional
+import pytest
+import uno._deals
+from uno import (
+    CounterRandom,
+    DealBank,
+    Deck,
+    Game,
+    RandomStrategy,
+    compare_strategies,
+    generate_deal_bank,
+)
+from uno._simulation import _SequentialTest
+
+
+def test_deal_bank_matches_seeded_decks(tmp_path) -> None:
+    path = tmp_path / "deals.bin"
+    generate_deal_bank(path, n_deals=5, seed=3)
+
+    with DealBank(path) as deals:
+        assert len(deals) == 5
+        for i in range(len(deals)):
+            deck = Deck(deal=deals[i])
+            expected = Deck(rng=CounterRandom(3, stream=i))
+            assert [repr(card) for card in deck] == [repr(card) for card in expected]
+
+
+def test_compare_strategies_on_deal_bank(tmp_path) -> None:
+    path = tmp_path / "deals.bin"
+    generate_deal_bank(path, n_deals=10)
+
+    with DealBank(path) as deals:
+        results = [
+            compare_strategies(
+                RandomStrategy(), RandomStrategy(), max_games=10, seed=1, deals=deals
+            )
+            for _ in range(2)
+        ]
+    assert results[0] == results[1]
+
+
+def test_deal_bank_close_can_be_retried_after_releasing_deals(tmp_path) -> None:
+    path = tmp_path / "deals.bin"
+    generate_deal_bank(path, n_deals=2)
+
+    deals = DealBank(path)
+    deal = deals[0]
+    with pytest.raises(BufferError):
+        deals.close()
+    assert len(deals[1]) == deals.deck_size
+
+    deal.release()
+    deals.close()
+
+
+def test_generate_deals_default_seed_matches_library_default(tmp_path) -> None:
+    generate_deal_bank(tmp_path / "a.bin", n_deals=3)
+    generate_deal_bank(tmp_path / "b.bin", n_deals=3, seed="0")
+    assert (tmp_path / "a.bin").read_bytes() == (tmp_path / "b.bin").read_bytes()
+
+
+class _StopAfter(_SequentialTest):
+    def __init__(self, n_games: int) -> None:
+        self.n_games = n_games
+
+    def update(self, win: bool) -> Optional[str]:
+        self.n_games -= 1
+        return "equal" if self.n_games == 0 else None
+
+
+def test_compare_strategies_reads_deals_lazily(tmp_path) -> None:
+    path = tmp_path / "deals.bin"
+    generate_deal_bank(path, n_deals=3)
+
+    with DealBank(path) as deals:
+        result = compare_strategies(
+            RandomStrategy(), RandomStrategy(), test=_StopAfter(3), deals=deals
+        )
+    assert result.n_games == 3
+
+
+def test_deal_bank_matches_game_played_with_stream(tmp_path) -> None:
+    path = tmp_path / "deals.bin"
+    generate_deal_bank(path, n_deals=2, seed=3)
+
+    with DealBank(path) as deals:
+        for i in range(len(deals)):
+            deck = Game(deal=deals[i]).dealer.deck
+            expected = Game(rng=CounterRandom(3, stream=i)).dealer.deck
+            assert [repr(card) for card in deck] == [repr(card) for card in expected]
+
+
+def test_generate_deal_bank_in_worker_processes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(uno._deals, "_CHUNK_SIZE", 2)
+    generate_deal_bank(tmp_path / "a.bin", n_deals=5)
+    generate_deal_bank(tmp_path / "b.bin", n_deals=5, n_jobs=2)
+    assert (tmp_path / "a.bin").read_bytes() == (tmp_path / "b.bin").read_bytes()
@@ -1,4 +1,4 @@
-from uno import generate_default_deck, Player
+from uno import generate_default_deck, Card, Player
 from copy import deepcopy
 
 
@@ -16,3 +16,14 @@ def test_play_removes_card_from_hand() -> None:
 
         assert len(player.hand) == (len(hand) - i)
         assert player.hand.count(card) == (n - 1)
+
+
+def test_play_removes_played_wild_card_object() -> None:
+    player = Player(name="Test player")
+    player.take([Card(None, "wild"), Card(None, "wild")])
+    played = player.hand[1]
+
+    player.play(top_card=Card("red", "1"), playable_cards=[played])
+
+    assert len(player.hand) == 1
+    assert all(card is not played for card in player.hand)
@@ -0,0 +1,70 @@
+import pickle
+import random
+from uno import CounterRandom, Dealer, Deck, generate_default_deck, generate_players
+
+
+def test_counter_random_streams_are_reproducible() -> None:
+    a = CounterRandom(seed=42, stream=3)
+    b = CounterRandom(seed=42, stream=3)
+    c = CounterRandom(seed=42, stream=4)
+
+    values = [a.random() for _ in range(10)]
+    assert values == [b.random() for _ in range(10)]
+    assert values != [c.random() for _ in range(10)]
+    assert all(0.0 <= value < 1.0 for value in values)
+
+
+def test_counter_random_jump() -> None:
+    a = CounterRandom(seed=42)
+    for _ in range(100):
+        a.getrandbits(64)
+    expected = a.getrandbits(64)
+
+    b = CounterRandom(seed=42)
+    b.jump(100)
+    assert b.getrandbits(64) == expected
+
+
+def test_counter_random_state() -> None:
+    rng = CounterRandom(seed="campaign")
+    rng.random()
+    state = rng.getstate()
+    expected = [rng.randrange(100) for _ in range(10)]
+
+    rng.setstate(state)
+    assert [rng.randrange(100) for _ in range(10)] == expected
+
+
+def test_game_setup_reproducible_from_seed_and_game_index() -> None:
+    a = Dealer(n_players=4, n_initial_cards=7, rng=CounterRandom(7, stream=5))
+    b = Dealer(n_players=4, n_initial_cards=7, rng=CounterRandom(7, stream=5))
+    assert [repr(card) for card in a.deck] == [repr(card) for card in b.deck]
+
+    a_players = generate_players(rng=CounterRandom(7, stream=5))
+    b_players = generate_players(rng=CounterRandom(7, stream=5))
+    assert [p.name for p in a_players.players] == [p.name for p in b_players.players]
+
+
+def test_counter_random_int_and_str_seeds_match() -> None:
+    assert CounterRandom(5, stream=2).random() == CounterRandom("5", stream=2).random()
+
+
+def test_counter_random_pickle_keeps_stream() -> None:
+    rng = CounterRandom(seed=42, stream=3)
+    rng.random()
+    copied = pickle.loads(pickle.dumps(rng))
+
+    assert copied.stream == 3
+    assert copied.random() == rng.random()
+    copied.seed(42)
+    rng.seed(42)
+    assert copied.random() == rng.random()
+
+
+def test_deck_without_rng_draws_from_random_module() -> None:
+    random.seed(4)
+    deck = Deck()
+    random.seed(4)
+    cards = generate_default_deck()
+    random.shuffle(cards)
+    assert [repr(card) for card in deck] == [repr(card) for card in cards]
@@ -0,0 +1,115 @@
+import pytest
+import logging
+import random
+import threading
+from typing import Optional
+from uno import (
+    COLORS,
+    SPRT,
+    Card,
+    Cards,
+    ConfidenceBoundTest,
+    RandomStrategy,
+    compare_strategies,
+)
+from uno._game import _Strategy, logger
+from uno._simulation import _SequentialTest
+
+
+@pytest.mark.parametrize("test_class", [SPRT, ConfidenceBoundTest])
+@pytest.mark.parametrize("win, expected", [(True, "a"), (False, "b")])
+def test_sequential_test_stops_early(test_class, win, expected) -> None:
+    test = test_class()
+    decision = None
+    n_games = 0
+    while decision is None:
+        decision = test.update(win)
+        n_games += 1
+        assert n_games < 1_000
+    assert decision == expected
+
+
+def test_sprt_rarely_decides_for_equally_strong_strategies() -> None:
+    rng = random.Random(0)
+    n_runs = 500
+    decisions = []
+    for _ in range(n_runs):
+        test = SPRT(alpha=0.05)
+        decision = None
+        while decision is None:
+            decision = test.update(rng.random() < 0.5)
+        decisions.append(decision)
+
+    # each of the two one-sided tests wrongly decides with probability alpha
+    n_false = sum(decision != "equal" for decision in decisions)
+    assert n_false / n_runs <= 2 * 0.05 + 0.03
+
+
+def test_compare_strategies_reports_games_saved() -> None:
+    result = compare_strategies(RandomStrategy(), RandomStrategy(), max_games=20)
+    assert 1 <= result.n_games <= 20
+    assert 0 <= result.n_wins <= result.n_games
+    assert result.n_games_saved == 20 - result.n_games
+    if result.winner is None:
+        assert result.n_games == 20
+
+
+def test_compare_strategies_reproducible_with_seed() -> None:
+    results = [
+        compare_strategies(RandomStrategy(), RandomStrategy(), max_games=10, seed=1)
+        for _ in range(2)
+    ]
+    assert results[0] == results[1]
+
+
+def test_compare_strategies_silences_game_trace(caplog) -> None:
+    with caplog.at_level(logging.INFO):
+        compare_strategies(RandomStrategy(), RandomStrategy(), max_games=2)
+    assert not caplog.records
+
+
+class _CallbackTest(_SequentialTest):
+    def __init__(self, callback) -> None:
+        self.callback = callback
+
+    def update(self, win: bool) -> Optional[str]:
+        self.callback(win)
+        return None
+
+
+def test_compare_strategies_leaves_logger_and_other_threads_untouched(
+    caplog,
+) -> None:
+    level = logger.level
+
+    def _log_from_other_thread(*args) -> None:
+        thread = threading.Thread(target=logger.info, args=("other game",))
+        thread.start()
+        thread.join()
+
+    with caplog.at_level(logging.INFO):
+        compare_strategies(
+            RandomStrategy(),
+            RandomStrategy(),
+            test=_CallbackTest(_log_from_other_thread),
+            max_games=1,
+        )
+    assert logger.level == level
+    assert [record.getMessage() for record in caplog.records] == ["other game"]
+
+
+class _FirstCardStrategy(_Strategy):
+    # uses the signatures without the rng argument
+    def select_card(self, legal_cards: Cards, top_card: Card) -> Card:
+        card = legal_cards[0]
+        if card.is_wild:
+            card.color = self.select_color()
+        return card
+
+    def select_color(self) -> str:
+        return COLORS[0]
+
+
+def test_compare_strategies_supports_strategies_without_rng() -> None:
+    result = compare_strategies(_FirstCardStrategy(), RandomStrategy(), max_games=3)
+    assert result.n_games >= 1
@@ -1 +1,5 @@
 from ._game import *  # noqa: F403
+from ._random import *  # noqa: F403
+from ._deals import *  # noqa: F403
+from ._simulation import *  # noqa: F403
+from ._cache import *  # noqa: F403
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Union
+import json
+import os
+import random
+
+from ._game import (
+    Card,
+    Cards,
+    _select_card,
+    _select_color,
+    _Strategy,
+    check_card,
+    check_cards,
+    check_int,
+)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _card_key(card: Card) -> tuple:
+    # wild cards are identified by their symbol only, ignoring any selected color
+    color = None if card.is_wild else card.color
+    return color, card.symbol
+
+
+def _to_tuple(x):
+    # json stores tuples as lists, convert them back into hashable tuples
+    return tuple(_to_tuple(item) for item in x) if isinstance(x, list) else x
+
+
+class CachedStrategy(_Strategy):
+    """Memoize the decisions of a deterministic strategy.
+
+    Card decisions are cached by a canonical state key made up of the
+    deduplicated legal cards, the top card and the active color, with least
+    recently used entries evicted once the cache is full. Only use this for
+    strategies that always make the same decision for the same key. Color
+    decisions take no state as input and are passed through uncached.
+
+    Parameters
+    ----------
+    strategy : _Strategy
+        Deterministic strategy to memoize.
+    maxsize : int
+        Maximum number of cached decisions.
+    """
+
+    def __init__(self, strategy: _Strategy, maxsize: int = 100_000) -> None:
+        assert isinstance(strategy, _Strategy)
+        self.strategy = strategy
+        self.maxsize = check_int(maxsize, min=1)
+
+        # cache state
+        self._cache: OrderedDict[Hashable, Optional[tuple]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Optional[tuple]]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return True, self._cache[key]
+        self.misses += 1
+        return False, None
+
+    def _store(self, key: Hashable, value: Optional[tuple]) -> None:
+        self._cache[key] = value
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def select_card(
+        self,
+        legal_cards: Cards,
+        top_card: Card,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Card]:
+        legal_cards = check_cards(legal_cards)
+        top_card = check_card(top_card)
+
+        key = (
+            tuple(sorted(set(map(_card_key, legal_cards)), key=repr)),
+            top_card.symbol,
+            top_card.color,
+        )
+        is_hit, value = self._lookup(key)
+        if is_hit:
+            if value is None:
+                return None
+            *card_key, color = value
+            card = next(c for c in legal_cards if _card_key(c) == tuple(card_key))
+            if card.is_wild:
+                card.color = color
+            return card
+
+        card = _select_card(
+            self.strategy, legal_cards=legal_cards, top_card=top_card, rng=rng
+        )
+        self._store(key, None if card is None else (*_card_key(card), card.color))
+        return card
+
+    def select_color(self, rng: Optional[random.Random] = None) -> str:
+        return _select_color(self.strategy, rng=rng)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Persist the cached decisions to a JSON file."""
+        data = {
+            "strategy": type(self.strategy).__name__,
+            "entries": [[key, value] for key, value in self._cache.items()],
+        }
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    def load(self, path: Union[str, os.PathLike]) -> None:
+        """Load cached decisions persisted by save for the same strategy."""
+        with open(path) as file:
+            data = json.load(file)
+        assert data["strategy"] == type(self.strategy).__name__
+        for key, value in data["entries"]:
+            self._store(_to_tuple(key), _to_tuple(value))
@@ -0,0 +1,136 @@
+from functools import partial
+from multiprocessing import Pool
+from typing import Optional, Union
+import mmap
+import os
+import struct
+
+from ._game import generate_default_deck, check_int
+from ._random import CounterRandom
+
+# file header with magic bytes, deck size and number of deals, followed by the
+# deals as packed arrays of one byte per card id
+_MAGIC = b"UNODEAL1"
+_HEADER = struct.Struct("<8sHQ")
+
+# number of deals generated at once by a worker process
+_CHUNK_SIZE = 10_000
+
+
+def _generate_deals(
+    start: int, seed: Union[int, str], n_deals: int, deck_size: int, chunk_size: int
+) -> bytes:
+    # generate the deals start, ..., start + chunk_size - 1, capped at n_deals
+    deals = bytearray()
+    for i in range(start, min(start + chunk_size, n_deals)):
+        deal = list(range(deck_size))
+        CounterRandom(seed, stream=i).shuffle(deal)
+        deals.extend(deal)
+    return bytes(deals)
+
+
+def generate_deal_bank(
+    path: Union[str, os.PathLike],
+    n_deals: int,
+    seed: Union[int, str] = 0,
+    n_jobs: int = 1,
+) -> None:
+    """Pre-generate shuffled deck orders and write them to a deal bank file.
+
+    Card ids are positions in the default deck as returned by
+    generate_default_deck. Deal i is the order of a deck shuffled with the
+    CounterRandom stream for (seed, i), so it matches the initial deck of a Game
+    played with that stream.
+
+    Generating a deal takes about 0.12 ms, i.e. about two minutes per million
+    deals on a single core. As streams are independent, generation can be split
+    across processes with the same result.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path of the deal bank file.
+    n_deals : int
+        Number of deals to generate.
+    seed : int or str
+        Campaign seed.
+    n_jobs : int
+        Number of worker processes.
+    """
+    n_deals = check_int(n_deals, min=1)
+    n_jobs = check_int(n_jobs, min=1)
+    deck_size = len(generate_default_deck())
+    generate = partial(
+        _generate_deals,
+        seed=seed,
+        n_deals=n_deals,
+        deck_size=deck_size,
+        chunk_size=_CHUNK_SIZE,
+    )
+    starts = range(0, n_deals, _CHUNK_SIZE)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, deck_size, n_deals))
+        if n_jobs == 1:
+            for start in starts:
+                file.write(generate(start))
+        else:
+            # chunks are returned in order, so the file is the same as without
+            # worker processes
+            with Pool(n_jobs) as pool:
+                for deals in pool.imap(generate, starts):
+                    file.write(deals)
+
+
+class DealBank:
+    """Read-only, memory-mapped deal bank.
+
+    Deals are returned as memoryviews into the mapped file without copying, so
+    worker processes opening the same file share its memory through the page
+    cache. Release any deals before closing the bank.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path of a deal bank file written by generate_deal_bank.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, deck_size, n_deals = _HEADER.unpack_from(self._mmap)
+        assert magic == _MAGIC
+        assert len(self._mmap) == _HEADER.size + deck_size * n_deals
+        self.deck_size: int = deck_size
+        self.n_deals: int = n_deals
+        self._view: Optional[memoryview] = memoryview(self._mmap)[_HEADER.size :]
+
+    def close(self) -> None:
+        if self._view is None:
+            return
+
+        # closing the mmap fails while any deals are still alive, in which case we
+        # restore the view so that closing can be retried after releasing them
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            self._view = memoryview(self._mmap)[_HEADER.size :]
+            raise
+        self._view = None
+
+    def __enter__(self) -> "DealBank":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_deals
+
+    def __getitem__(self, item: int) -> memoryview:
+        assert self._view is not None
+        item = check_int(item)
+        assert 0 <= item < self.n_deals
+        start = item * self.deck_size
+        return self._view[start : start + self.deck_size]
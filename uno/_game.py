@@ -1,9 +1,22 @@
-from typing import Iterator, Optional
+from contextvars import ContextVar
+from typing import Iterator, Optional, Sequence
 import random
 import itertools
+import logging
+
+from ._random import get_rng
+
+# game traces are logged rather than printed, so that simulations can turn them off
+logger = logging.getLogger(__name__)
+
+# set by simulations to drop the game trace of their own thread or task only,
+# leaving the logger configuration and any other games untouched
+_is_quiet: ContextVar[bool] = ContextVar("is_quiet", default=False)
+logger.addFilter(lambda record: not _is_quiet.get())
 
 N_MIN_PLAYERS = 2
 N_MAX_PLAYERS = 5
+N_DEFAULT_PLAYERS = 4
 COLORS = ("red", "blue", "green", "yellow")
 COLOR_CODES = {
     "red": "\033[31m",
@@ -56,8 +69,13 @@ class Card:
 
     def copy(self):
         # return a new card with the original constructor arguments, ignoring the color
-        # attribute set in wild cards after construction
-        return type(self)(**self._init_kwargs)
+        # attribute set in wild cards after construction; the attributes are copied
+        # directly as the arguments have already been checked, which is much faster
+        # than calling the constructor again
+        card = object.__new__(type(self))
+        card.__dict__.update(self.__dict__)
+        card.color = self._init_kwargs["color"]
+        return card
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Card):
@@ -152,6 +170,11 @@ def generate_default_deck() -> Cards:
     return cards
 
 
+# prototype cards of the default deck, indexed by card id, to build decks from
+# pre-shuffled deals without constructing the deck again
+_DEFAULT_DECK = generate_default_deck()
+
+
 def check_int(x: int, min: Optional[int] = None, max: Optional[int] = None) -> int:
     assert isinstance(x, int)
     if min:
@@ -162,9 +185,20 @@ def check_int(x: int, min: Optional[int] = None, max: Optional[int] = None) -> i
 
 
 class Deck:
-    def __init__(self) -> None:
-        self.cards = generate_default_deck()
-        random.shuffle(self.cards)
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        deal: Optional[Sequence[int]] = None,
+    ) -> None:
+        self.rng = get_rng(rng)
+        if deal is None:
+            self.cards = generate_default_deck()
+            self.rng.shuffle(self.cards)
+        else:
+            # use the pre-shuffled order of card ids, i.e. positions in the
+            # default deck, instead of shuffling the deck, e.g. from a DealBank
+            assert len(deal) == len(_DEFAULT_DECK)
+            self.cards = [_DEFAULT_DECK[card_id].copy() for card_id in deal]
 
     def draw(self, n: int = 1) -> Cards:
         n = check_int(n, min=1)
@@ -177,7 +211,7 @@ class Deck:
         assert len(self.cards) == 0
         cards = check_cards(cards)
         self.cards.extend(cards)
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def __len__(self) -> int:
         return len(self.cards)
@@ -187,8 +221,14 @@ class Deck:
 
 
 class Dealer:
-    def __init__(self, n_players: int, n_initial_cards: int) -> None:
-        self.deck = Deck()
+    def __init__(
+        self,
+        n_players: int,
+        n_initial_cards: int,
+        rng: Optional[random.Random] = None,
+        deal: Optional[Sequence[int]] = None,
+    ) -> None:
+        self.deck = Deck(rng=rng, deal=deal)
         self.pile = Pile()
 
         self.n_players = check_int(n_players, min=2, max=5)
@@ -214,10 +254,11 @@ class Dealer:
             # draw all available cards, recyle pile and draw remaining cards
             n_remaining = n - n_available
             all_cards = []
-            cards = self.deck.draw(n=n_available)
-            all_cards.extend(cards)
+            if n_available > 0:
+                cards = self.deck.draw(n=n_available)
+                all_cards.extend(cards)
 
-            print("Reclying pile ...")
+            logger.info("Reclying pile ...")
             cards = self.pile.recycle()
             self.deck.refill(cards)
 
@@ -235,31 +276,69 @@ class Dealer:
 
 
 class _Strategy:
-    def select_card(self, legal_cards: Cards, top_card: Card) -> Optional[Card]:
+    # strategies are shared across games, so any randomness is drawn from the
+    # random number generator of the game passed in as rng; rng is only passed to
+    # strategies in games with their own generator, so strategies without the rng
+    # argument keep working in all other games
+    def select_card(
+        self,
+        legal_cards: Cards,
+        top_card: Card,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Card]:
         # TODO use entire game state as input instead of just top_card
         raise NotImplementedError("abstract method")
 
-    def select_color(self) -> str:
+    def select_color(self, rng: Optional[random.Random] = None) -> str:
         # TODO use entire game state as input instead of just top_card
         raise NotImplementedError("abstract method")
 
 
+def _select_card(
+    strategy: _Strategy,
+    legal_cards: Cards,
+    top_card: Card,
+    rng: Optional[random.Random] = None,
+) -> Optional[Card]:
+    # only pass rng if given, to support strategies without the rng argument
+    if rng is None:
+        return strategy.select_card(legal_cards=legal_cards, top_card=top_card)
+    return strategy.select_card(legal_cards=legal_cards, top_card=top_card, rng=rng)
+
+
+def _select_color(strategy: _Strategy, rng: Optional[random.Random] = None) -> str:
+    # only pass rng if given, to support strategies without the rng argument
+    if rng is None:
+        return strategy.select_color()
+    return strategy.select_color(rng=rng)
+
+
 class RandomStrategy(_Strategy):
-    def select_card(self, legal_cards: Cards, top_card: Card) -> Optional[Card]:
+    def select_card(
+        self,
+        legal_cards: Cards,
+        top_card: Card,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Card]:
         legal_cards = check_cards(legal_cards)
         top_card = check_card(top_card)
 
-        card = random.choice(legal_cards)
+        card = get_rng(rng).choice(legal_cards)
         if card.is_wild:
-            card.color = self.select_color()
+            card.color = self.select_color(rng=rng)
         return card
 
-    def select_color(self) -> str:
-        return random.choice(COLORS)
+    def select_color(self, rng: Optional[random.Random] = None) -> str:
+        return get_rng(rng).choice(COLORS)
 
 
 class HumanInput(_Strategy):
-    def select_card(self, legal_cards: Cards, top_card: Card) -> Optional[Card]:
+    def select_card(
+        self,
+        legal_cards: Cards,
+        top_card: Card,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Card]:
         legal_cards = check_cards(legal_cards)
         top_card = check_card(top_card)
 
@@ -271,7 +350,7 @@ class HumanInput(_Strategy):
             card.color = self.select_color()
         return card
 
-    def select_color(self) -> str:
+    def select_color(self, rng: Optional[random.Random] = None) -> str:
         print(f"Colors: {[(index, color) for index, color in enumerate(COLORS)]}")
         index = int(input("Select index: "))
         return COLORS[index]
@@ -314,22 +393,28 @@ def filter_legal_cards(cards: Cards, top_card: Card) -> Cards:
 
 
 class Player:
-    def __init__(self, name: str, strategy: Optional[_Strategy] = None) -> None:
+    def __init__(
+        self,
+        name: str,
+        strategy: Optional[_Strategy] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         if not strategy:
             strategy = RandomStrategy()
 
         self.name = name
         self.strategy = strategy
+        self.rng = rng
 
         # player state
         self.hand: Cards = []
 
     def take(self, cards: Cards) -> None:
         cards = check_cards(cards)
-        print(f"Hand before: {self.hand}")
+        logger.info("Hand before: %s", self.hand)
         self.hand.extend(cards)
-        print(f"{self.name} took: {cards}")
-        print(f"Hand after: {self.hand}")
+        logger.info("%s took: %s", self.name, cards)
+        logger.info("Hand after: %s", self.hand)
 
     def select_card(
         self, top_card: Card, playable_cards: Optional[Cards] = None
@@ -342,25 +427,37 @@ class Player:
 
         legal_cards = filter_legal_cards(cards=playable_cards, top_card=top_card)
         if legal_cards:
-            card = self.strategy.select_card(legal_cards=legal_cards, top_card=top_card)
+            card = _select_card(
+                self.strategy, legal_cards=legal_cards, top_card=top_card, rng=self.rng
+            )
             return card
         else:
             return None
 
     def select_color(self) -> str:
-        return self.strategy.select_color()
+        return _select_color(self.strategy, rng=self.rng)
+
+    def _remove(self, card: Card) -> None:
+        # remove the played card object itself if it is in the hand, as wild cards
+        # compare equal regardless of their color and removing another equal card
+        # would leave the played card both in the hand and on the pile
+        for index, hand_card in enumerate(self.hand):
+            if hand_card is card:
+                del self.hand[index]
+                return
+        self.hand.remove(card)
 
     def play(
         self, top_card: Card, playable_cards: Optional[Cards] = None
     ) -> Optional[Card]:
-        print(f"Hand before: {self.hand}")
+        logger.info("Hand before: %s", self.hand)
         card = self.select_card(top_card=top_card, playable_cards=playable_cards)
         if card:
-            self.hand.remove(card)
-            print(f"{self.name} played: {card}")
-            print(f"Hand after: {self.hand}")
+            self._remove(card)
+            logger.info("%s played: %s", self.name, card)
+            logger.info("Hand after: %s", self.hand)
             if len(self.hand) == 1:
-                print(f"{self.name}: Uno!")
+                logger.info("%s: Uno!", self.name)
         return card
 
 
@@ -433,7 +530,11 @@ def check_players(players: list[Player]) -> list[Player]:
     return players
 
 
-def generate_players(n_players: int = 4, human_player: Optional[str] = None) -> Players:
+def generate_players(
+    n_players: int = N_DEFAULT_PLAYERS,
+    human_player: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+) -> Players:
     assert N_MIN_PLAYERS <= n_players <= N_MAX_PLAYERS
     n_human_players = 1 if human_player else 0
     assert n_human_players <= n_players
@@ -443,14 +544,14 @@ def generate_players(n_players: int = 4, human_player: Optional[str] = None) ->
     players = []
     for i in range(n_computer_players):
         name = names[i]
-        player = Player(name=name)
+        player = Player(name=name, rng=rng)
         players.append(player)
 
     if human_player:
         player = Player(name=human_player, strategy=HumanInput())
         players.append(player)
 
-    random.shuffle(players)
+    get_rng(rng).shuffle(players)
     return Players(players)
 
 
@@ -479,17 +580,15 @@ def execute_card_action(card: Card, dealer: Dealer, players: Players) -> None:
 
 
 def print_turn_info(players: Players, dealer: Dealer) -> None:
-    # TODO add proper logging and terminal output
-    msg = " ".join(
-        [
-            f"Turn={players.turn}",
-            f"Player={getattr(players.current, 'name', 'initial')}",
-            f"Top card={dealer.get_top_card()}",
-            f"Deck={len(dealer.deck)}",
-            f"Pile={len(dealer.pile)}",
-        ]
+    # TODO add proper terminal output
+    logger.info(
+        "Turn=%s Player=%s Top card=%s Deck=%s Pile=%s",
+        players.turn,
+        getattr(players.current, "name", "initial"),
+        dealer.get_top_card(),
+        len(dealer.deck),
+        len(dealer.pile),
     )
-    print(msg)
 
 
 class Game:
@@ -497,26 +596,50 @@ class Game:
         self,
         human_player: Optional[str] = None,
         n_initial_cards: int = 7,
+        players: Optional[Players] = None,
+        rng: Optional[random.Random] = None,
+        deal: Optional[Sequence[int]] = None,
     ) -> None:
-        self.players = generate_players(human_player=human_player)
+        # draw all randomness of the game from rng, e.g. a CounterRandom seeded
+        # with the campaign seed and game index, so that the game can be
+        # reproduced on its own
+        if players:
+            # players are passed in directly, e.g. when simulating games between
+            # given strategies, so we cannot add a human player on top of them
+            assert human_player is None
+            assert isinstance(players, Players)
+        n_players = len(players) if players else N_DEFAULT_PLAYERS
+
+        # shuffle the deck before seating the players, so that the deck of a game
+        # played with the stream for (seed, i) matches deal i of a DealBank
+        # generated with seed
         self.dealer = Dealer(
-            n_players=len(self.players), n_initial_cards=n_initial_cards
+            n_players=n_players,
+            n_initial_cards=n_initial_cards,
+            rng=rng,
+            deal=deal,
         )
+        if players:
+            self.players = players
+        else:
+            self.players = generate_players(
+                n_players=n_players, human_player=human_player, rng=rng
+            )
 
-    def run(self) -> None:
-        print("Running Uno ...")
+    def run(self) -> Player:
+        logger.info("Running Uno ...")
         players = self.players
         dealer = self.dealer
-        print(f"Players={[player.name for player in players.players]}")
+        logger.info("Players=%s", [player.name for player in players.players])
 
         # draw initial player hands
-        print("Drawing initial hands ...")
+        logger.info("Drawing initial hands ...")
         hands = dealer.draw_initial_hands()
         for player, hand in zip(players.players, hands):
             player.take(hand)
 
         # initial turn
-        print("Initial turn ...")
+        logger.info("Initial turn ...")
         dealer.flip_initial_card()
         card: Optional[Card] = dealer.get_top_card()
 
@@ -532,7 +655,7 @@ class Game:
         print_turn_info(players=players, dealer=dealer)
 
         # players take turns until one of them wins
-        print("Player turns ...")
+        logger.info("Player turns ...")
         while True:
             # execute any card action
             if card and card.is_action:
@@ -563,5 +686,5 @@ class Game:
                 check_legal(card=card, top_card=top_card, playable_cards=playable_cards)
                 dealer.discard(card)
                 if is_game_over(player=player):
-                    print(f"Game over. Player: {player.name} won!")
-                    break
+                    logger.info("Game over. Player: %s won!", player.name)
+                    return player
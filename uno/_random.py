@@ -0,0 +1,126 @@
+from typing import Any, Optional, Union
+import hashlib
+import random
+import struct
+
+_WORD_BITS = 64
+# number of 64-bit words taken from each hash, the maximum digest size of blake2b
+# is 64 bytes
+_BLOCK_WORDS = 8
+
+
+def _derive_key(seed: Union[int, str], stream: int) -> bytes:
+    # hash seed and stream into a fixed-size key, so that neighbouring seeds or
+    # streams do not produce related outputs; seeds are normalized to strings, so
+    # that seeds parsed from the command line match the same integer seeds
+    assert isinstance(seed, (int, str))
+    assert isinstance(stream, int) and stream >= 0
+    data = f"{seed}:{stream}".encode()
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+class CounterRandom(random.Random):
+    """Counter-based random number generator.
+
+    The i-th word of 64 random bits is taken from a keyed hash of the block
+    counter i // 8, where the key is derived from the seed and the stream, e.g.
+    the campaign seed and the game index. Every stream can thus be generated
+    directly without replaying other streams, and the generator can jump to any
+    word in a stream by setting the counter. Each hash yields eight words, so
+    that consecutive draws only hash once every eight words.
+
+    All methods of random.Random, e.g. shuffle or choice, are supported.
+
+    Parameters
+    ----------
+    seed : int or str
+        Seed shared by all streams, e.g. of a campaign of games. Integer seeds
+        give the same streams as their string representation, e.g. 5 and "5".
+    stream : int
+        Index of the stream, e.g. of a game in a campaign.
+    """
+
+    def __init__(self, seed: Union[int, str] = 0, stream: int = 0) -> None:
+        self.stream = stream
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        # seeding restarts the current stream from the beginning
+        assert a is not None
+        self._key = _derive_key(a, self.stream)
+        self.counter = 0
+        self.gauss_next = None
+        self._clear_block()
+
+    def getstate(self) -> tuple:
+        # include the stream, as pickling and copying restore the state on a
+        # generator constructed with default arguments
+        return self.stream, self._key, self.counter, self.gauss_next
+
+    def setstate(self, state: tuple) -> None:
+        self.stream, self._key, self.counter, self.gauss_next = state
+        self._clear_block()
+
+    def jump(self, counter: int) -> None:
+        """Move to the given position in the stream in constant time."""
+        assert isinstance(counter, int) and counter >= 0
+        self.counter = counter
+
+    def _clear_block(self) -> None:
+        # cache of the words of the last hashed block, derived from the key
+        self._block_index = -1
+        self._block: tuple[int, ...] = ()
+
+    def _next_word(self) -> int:
+        block_index, offset = divmod(self.counter, _BLOCK_WORDS)
+        if block_index != self._block_index:
+            digest = hashlib.blake2b(
+                block_index.to_bytes(8, "little"),
+                key=self._key,
+                digest_size=8 * _BLOCK_WORDS,
+            ).digest()
+            self._block = struct.unpack(f"<{_BLOCK_WORDS}Q", digest)
+            self._block_index = block_index
+        self.counter += 1
+        return self._block[offset]
+
+    def getrandbits(self, k: int) -> int:
+        assert k >= 0
+        if k <= _WORD_BITS:
+            # fast path for the small draws of shuffle and choice
+            return self._next_word() >> (_WORD_BITS - k)
+        bits = 0
+        n_bits = 0
+        while n_bits < k:
+            bits |= self._next_word() << n_bits
+            n_bits += _WORD_BITS
+        return bits >> (n_bits - k)
+
+    def random(self) -> float:
+        # 53 random bits fill the mantissa of a double
+        return self.getrandbits(53) * 2**-53
+
+
+class _ModuleRandom(random.Random):
+    # draw from the functions of the random module, so that seeding the random
+    # module keeps working for games without a generator of their own; shuffle,
+    # choice and the other methods are built on random and getrandbits, so they
+    # give the same results as the functions of the random module
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        # called by the constructor, seed the random module with random.seed
+        pass
+
+    def random(self) -> float:
+        return random.random()
+
+    def getrandbits(self, k: int) -> int:
+        return random.getrandbits(k)
+
+
+_MODULE_RANDOM = _ModuleRandom()
+
+
+def get_rng(rng: Optional[random.Random] = None) -> random.Random:
+    # default to the functions of the random module
+    return rng if rng is not None else _MODULE_RANDOM
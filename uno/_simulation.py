@@ -0,0 +1,250 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Union
+import math
+import random
+
+from ._deals import DealBank
+from ._game import Game, Player, Players, _Strategy, _is_quiet, check_int
+from ._random import CounterRandom
+
+
+class _SequentialTest:
+    """Sequential test on the win rate of strategy A against strategy B.
+
+    The test is updated after every game and decides as soon as the configured
+    significance is reached, so that comparisons do not have to run a fixed
+    number of games.
+    """
+
+    def update(self, win: bool) -> Optional[str]:
+        """Update the test with the outcome of a single game.
+
+        Parameters
+        ----------
+        win : bool
+            Whether strategy A won the game.
+
+        Returns
+        -------
+        Optional[str]
+            "a" if strategy A is stronger, "b" if strategy B is stronger, "equal"
+            if neither is stronger, or None if no decision can be made yet.
+        """
+        raise NotImplementedError("abstract method")
+
+
+def check_probability(x: float) -> float:
+    assert isinstance(x, float)
+    assert 0.0 < x < 1.0
+    return x
+
+
+class SPRT(_SequentialTest):
+    """Wald's sequential probability ratio test (SPRT).
+
+    Runs two one-sided tests of the hypothesis that strategy A wins with
+    probability 0.5, one against the hypothesis that it wins with probability
+    0.5 + delta and one against 0.5 - delta. The test decides for the stronger
+    strategy as soon as one of them rejects 0.5, or "equal" once both accept it.
+
+    Parameters
+    ----------
+    delta : float
+        Minimum difference in win rate from 0.5 to detect.
+    alpha : float
+        Probability of wrongly deciding for a strategy in each of the one-sided
+        tests, if both strategies are equally strong.
+    beta : float
+        Probability of wrongly deciding "equal" in each of the one-sided tests,
+        if one strategy is stronger by delta.
+    """
+
+    def __init__(self, delta: float = 0.05, alpha: float = 0.05, beta: float = 0.05):
+        self.delta = check_probability(delta)
+        self.alpha = check_probability(alpha)
+        self.beta = check_probability(beta)
+        assert self.delta < 0.5
+
+        # log-likelihood ratios of a win and a loss of strategy A for 0.5 + delta
+        # against 0.5, the ones for 0.5 - delta are the same with win and loss
+        # swapped
+        self._llr_win = math.log(1 + 2 * self.delta)
+        self._llr_loss = math.log(1 - 2 * self.delta)
+        self._upper = math.log((1 - self.beta) / self.alpha)
+        self._lower = math.log(self.beta / (1 - self.alpha))
+
+        # test state, the decision of each one-sided test is None until it stops
+        self.llr_a = 0.0
+        self.llr_b = 0.0
+        self._is_equal_a: Optional[bool] = None
+        self._is_equal_b: Optional[bool] = None
+
+    def update(self, win: bool) -> Optional[str]:
+        self.llr_a += self._llr_win if win else self._llr_loss
+        self.llr_b += self._llr_loss if win else self._llr_win
+
+        if self._is_equal_a is None:
+            if self.llr_a >= self._upper:
+                return "a"
+            if self.llr_a <= self._lower:
+                self._is_equal_a = True
+        if self._is_equal_b is None:
+            if self.llr_b >= self._upper:
+                return "b"
+            if self.llr_b <= self._lower:
+                self._is_equal_b = True
+
+        if self._is_equal_a and self._is_equal_b:
+            return "equal"
+        return None
+
+
+class ConfidenceBoundTest(_SequentialTest):
+    """Stop as soon as a confidence interval of the win rate excludes 0.5.
+
+    Uses an anytime-valid Hoeffding bound, taking a union bound over the number
+    of games, so that the interval can be checked after every game.
+
+    Parameters
+    ----------
+    alpha : float
+        Probability of wrongly deciding that one of the strategies is stronger.
+    """
+
+    def __init__(self, alpha: float = 0.05):
+        self.alpha = check_probability(alpha)
+
+        # test state
+        self.n_games = 0
+        self.n_wins = 0
+
+    def update(self, win: bool) -> Optional[str]:
+        self.n_games += 1
+        self.n_wins += int(win)
+
+        n = self.n_games
+        win_rate = self.n_wins / n
+        radius = math.sqrt(math.log(4 * n**2 / self.alpha) / (2 * n))
+        if win_rate - radius > 0.5:
+            return "a"
+        if win_rate + radius < 0.5:
+            return "b"
+        return None
+
+
+@dataclass
+class ComparisonResult:
+    """Result of comparing two strategies with a sequential test."""
+
+    n_games: int
+    n_wins: int
+    max_games: int
+    # "a" or "b" for the stronger strategy, "equal" if neither is stronger, None if
+    # the test was inconclusive
+    winner: Optional[str]
+
+    @property
+    def win_rate(self) -> float:
+        return self.n_wins / self.n_games
+
+    @property
+    def n_games_saved(self) -> int:
+        return self.max_games - self.n_games
+
+
+def play_game(
+    strategy_a: _Strategy,
+    strategy_b: _Strategy,
+    a_first: bool,
+    rng: Optional[random.Random] = None,
+    deal: Optional[Sequence[int]] = None,
+) -> bool:
+    """Play a single two-player game and return whether strategy A won."""
+    players = [
+        Player(name="A", strategy=strategy_a, rng=rng),
+        Player(name="B", strategy=strategy_b, rng=rng),
+    ]
+    if not a_first:
+        players.reverse()
+    game = Game(players=Players(players), rng=rng, deal=deal)
+    winner = game.run()
+    return winner.name == "A"
+
+
+@contextmanager
+def _log_games(verbose: bool) -> Iterator[None]:
+    # silence the per-turn game trace of the current thread or task unless asked
+    # for, restoring the previous setting afterwards so that nesting works
+    token = _is_quiet.set(not verbose)
+    try:
+        yield
+    finally:
+        _is_quiet.reset(token)
+
+
+def compare_strategies(
+    strategy_a: _Strategy,
+    strategy_b: _Strategy,
+    test: Optional[_SequentialTest] = None,
+    max_games: int = 10_000,
+    seed: Optional[Union[int, str]] = None,
+    deals: Optional[DealBank] = None,
+    verbose: bool = False,
+) -> ComparisonResult:
+    """Compare two strategies in two-player games until the test decides.
+
+    Parameters
+    ----------
+    strategy_a, strategy_b : _Strategy
+        Strategies to compare.
+    test : _SequentialTest, optional
+        Sequential test on the win rate of strategy A, defaults to SPRT.
+    max_games : int
+        Maximum number of games to play if the test does not decide earlier.
+    seed : int or str, optional
+        Campaign seed. If given, the i-th game draws from its own CounterRandom
+        stream for (seed, i), so that any game can be reproduced on its own.
+        Otherwise, games draw from the global random module.
+    deals : DealBank, optional
+        Pre-generated deals, deal i is used as initial deck of the i-th game,
+        so that different comparisons are evaluated on the same deals. Deals are
+        read lazily, so the bank only needs to cover the games actually played
+        before the test decides, otherwise the comparison fails.
+    verbose : bool
+        Whether to log the trace of every game.
+
+    Returns
+    -------
+    ComparisonResult
+    """
+    assert isinstance(strategy_a, _Strategy)
+    assert isinstance(strategy_b, _Strategy)
+    max_games = check_int(max_games, min=1)
+    if test is None:
+        test = SPRT()
+    assert isinstance(test, _SequentialTest)
+
+    n_games = 0
+    n_wins = 0
+    winner = None
+    with _log_games(verbose):
+        while n_games < max_games:
+            rng = CounterRandom(seed, stream=n_games) if seed is not None else None
+            deal = deals[n_games] if deals is not None else None
+
+            # alternate who plays first to cancel out any first-player advantage
+            a_first = n_games % 2 == 0
+            win = play_game(
+                strategy_a, strategy_b, a_first=a_first, rng=rng, deal=deal
+            )
+            n_games += 1
+            n_wins += int(win)
+
+            winner = test.update(win)
+            if winner:
+                break
+
+    return ComparisonResult(
+        n_games=n_games, n_wins=n_wins, max_games=max_games, winner=winner
+    )